@@ -1,6 +1,8 @@
+import queue
+import uuid
 import ibm_db
 import psycopg2
-from sqlalchemy import create_engine
+from psycopg2 import pool as pg_pool
 import logging
 from typing import Dict, Any, Optional
 
@@ -8,114 +10,309 @@ class DatabaseConnection:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        
+
     def test_connection(self) -> bool:
         raise NotImplementedError
 
 class DB2Connection(DatabaseConnection):
+    POOL_SIZE = 5
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.connection = None
-        self.engine = None
-        
+        self._engine = None
+        self._pool = queue.Queue(maxsize=config.get('pool_size', self.POOL_SIZE))
+
+    @property
+    def engine(self):
+        """SQLAlchemy engine, built lazily on first access"""
+        if self._engine is None:
+            from sqlalchemy import create_engine
+            db_uri = f"db2+ibm_db://{self.config['user']}:{self.config['password']}@{self.config['host']}:{self.config['port']}/{self.config['database']}"
+            self._engine = create_engine(db_uri)
+        return self._engine
+
+    def _new_connection(self):
+        dsn = f"DATABASE={self.config['database']};HOSTNAME={self.config['host']};PORT={self.config['port']};PROTOCOL=TCPIP;UID={self.config['user']};PWD={self.config['password']};"
+        return ibm_db.connect(dsn, "", "")
+
+    def _acquire(self):
+        try:
+            handle = self._pool.get_nowait()
+            # Drop dead handles instead of handing them to callers
+            if ibm_db.active(handle):
+                return handle
+        except queue.Empty:
+            pass
+        return self._new_connection()
+
+    def _release(self, handle) -> None:
+        try:
+            self._pool.put_nowait(handle)
+        except queue.Full:
+            ibm_db.close(handle)
+
+    @staticmethod
+    def _column_names(stmt) -> tuple:
+        return tuple(ibm_db.field_name(stmt, i) for i in range(ibm_db.num_fields(stmt)))
+
+    def describe_columns(self, query: str) -> Optional[list]:
+        """Return (column_name, driver_type_name) pairs without fetching rows"""
+        try:
+            self._ensure_connected()
+
+            handle = self._acquire()
+            try:
+                stmt = ibm_db.prepare(handle, query)
+                ibm_db.execute(stmt)
+                return [(ibm_db.field_name(stmt, i), ibm_db.field_type(stmt, i))
+                        for i in range(ibm_db.num_fields(stmt))]
+            finally:
+                self._release(handle)
+        except Exception as e:
+            self.logger.error(f"Error describing DB2 query: {e}")
+            return None
+
     def connect(self) -> bool:
         try:
-            dsn = f"DATABASE={self.config['database']};HOSTNAME={self.config['host']};PORT={self.config['port']};PROTOCOL=TCPIP;UID={self.config['user']};PWD={self.config['password']};"
-            self.connection = ibm_db.connect(dsn, "", "")
-            
-            # Create SQLAlchemy engine for easier querying
-            db_uri = f"db2+ibm_db://{self.config['user']}:{self.config['password']}@{self.config['host']}:{self.config['port']}/{self.config['database']}"
-            self.engine = create_engine(db_uri)
-            
+            self.connection = self._new_connection()
+            self._release(self.connection)
+
             self.logger.info("Successfully connected to DB2")
             return True
         except Exception as e:
             self.logger.error(f"Failed to connect to DB2: {e}")
             return False
-            
+
     def test_connection(self) -> bool:
+        # Idempotent: an existing live handle means no extra handshake
+        if self.connection is not None and ibm_db.active(self.connection):
+            return True
         return self.connect()
-        
-    def execute_query(self, query: str) -> Optional[list]:
+
+    def _ensure_connected(self) -> None:
+        if not self.connection:
+            self.connect()
+
+    def execute_query(self, query: str, params: tuple = None) -> Optional[list]:
         try:
-            if not self.connection:
-                self.connect()
-                
-            stmt = ibm_db.exec_immediate(self.connection, query)
-            results = []
-            
-            row = ibm_db.fetch_assoc(stmt)
-            while row:
-                results.append(row)
-                row = ibm_db.fetch_assoc(stmt)
-                
-            return results
+            self._ensure_connected()
+
+            handle = self._acquire()
+            try:
+                if params:
+                    stmt = ibm_db.prepare(handle, query)
+                    ibm_db.execute(stmt, params)
+                else:
+                    stmt = ibm_db.exec_immediate(handle, query)
+
+                # fetch_tuple with one shared header avoids fetch_assoc's
+                # per-row dict-and-key allocation in the driver
+                columns = self._column_names(stmt)
+                results = []
+
+                row = ibm_db.fetch_tuple(stmt)
+                while row:
+                    results.append(dict(zip(columns, row)))
+                    row = ibm_db.fetch_tuple(stmt)
+
+                return results
+            finally:
+                self._release(handle)
         except Exception as e:
             self.logger.error(f"Error executing DB2 query: {e}")
             return None
-            
+
+    def execute_query_iter(self, query: str, chunk_size: int = 50000, params: tuple = None, as_dict: bool = True):
+        """Stream query results as chunks of rows to cap memory
+
+        Rows are dicts by default; as_dict=False yields bare tuples in
+        column order, skipping one dict allocation per row.
+        """
+        try:
+            self._ensure_connected()
+
+            handle = self._acquire()
+            try:
+                stmt = ibm_db.prepare(handle, query)
+                try:
+                    # Let the driver prefetch row batches while we consume
+                    ibm_db.set_option(
+                        stmt, {ibm_db.SQL_ATTR_ROWCOUNT_PREFETCH: ibm_db.SQL_ROWCOUNT_PREFETCH_ON}, 0)
+                except Exception:
+                    pass
+                if params:
+                    ibm_db.execute(stmt, params)
+                else:
+                    ibm_db.execute(stmt)
+                columns = self._column_names(stmt)
+                chunk = []
+
+                row = ibm_db.fetch_tuple(stmt)
+                while row:
+                    chunk.append(dict(zip(columns, row)) if as_dict else row)
+                    if len(chunk) >= chunk_size:
+                        yield chunk
+                        chunk = []
+                    row = ibm_db.fetch_tuple(stmt)
+
+                if chunk:
+                    yield chunk
+            finally:
+                self._release(handle)
+        except Exception as e:
+            self.logger.error(f"Error streaming DB2 query: {e}")
+
     def close(self):
-        if self.connection:
-            ibm_db.close(self.connection)
-        if self.engine:
-            self.engine.dispose()
+        while True:
+            try:
+                ibm_db.close(self._pool.get_nowait())
+            except queue.Empty:
+                break
+            except Exception:
+                pass
+        self.connection = None
+        if self._engine:
+            self._engine.dispose()
+            self._engine = None
 
 class PostgreSQLConnection(DatabaseConnection):
+    MIN_POOL_SIZE = 2
+    MAX_POOL_SIZE = 10
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.connection = None
-        self.engine = None
-        
+        self._engine = None
+        self._pool = None
+
+    @property
+    def engine(self):
+        """SQLAlchemy engine, built lazily on first access"""
+        if self._engine is None:
+            from sqlalchemy import create_engine
+            db_uri = f"postgresql://{self.config['user']}:{self.config['password']}@{self.config['host']}:{self.config['port']}/{self.config['database']}"
+            self._engine = create_engine(db_uri)
+        return self._engine
+
     def connect(self) -> bool:
         try:
-            self.connection = psycopg2.connect(
+            self._pool = pg_pool.ThreadedConnectionPool(
+                minconn=self.MIN_POOL_SIZE,
+                maxconn=self.config.get('pool_size', self.MAX_POOL_SIZE),
                 host=self.config['host'],
                 port=self.config['port'],
                 database=self.config['database'],
                 user=self.config['user'],
                 password=self.config['password']
             )
-            
-            # Create SQLAlchemy engine
-            db_uri = f"postgresql://{self.config['user']}:{self.config['password']}@{self.config['host']}:{self.config['port']}/{self.config['database']}"
-            self.engine = create_engine(db_uri)
-            
+            # Dedicated handle for callers that need a raw session (COPY, temp tables)
+            self.connection = self._pool.getconn()
+
             self.logger.info("Successfully connected to PostgreSQL")
             return True
         except Exception as e:
             self.logger.error(f"Failed to connect to PostgreSQL: {e}")
             return False
-            
+
     def test_connection(self) -> bool:
+        # Idempotent: an existing pool means no extra handshake
+        if self._pool is not None:
+            return True
         return self.connect()
-        
-    def execute_query(self, query: str) -> Optional[list]:
+
+    def _ensure_connected(self) -> None:
+        if not self._pool:
+            self.connect()
+
+    def _checkout(self):
+        """Get a pooled connection, replacing it if the socket is dead"""
+        connection = self._pool.getconn()
+        if connection.closed:
+            self._pool.putconn(connection, close=True)
+            connection = self._checkout()
+        return connection
+
+    def execute_query(self, query: str, params: tuple = None) -> Optional[list]:
         try:
-            if not self.connection:
-                self.connect()
-                
-            cursor = self.connection.cursor()
-            cursor.execute(query)
-            
-            # Get column names
-            columns = [desc[0] for desc in cursor.description]
-            
-            # Fetch all rows
-            rows = cursor.fetchall()
-            
-            # Convert to list of dictionaries
-            results = []
-            for row in rows:
-                results.append(dict(zip(columns, row)))
-                
-            cursor.close()
-            return results
+            self._ensure_connected()
+
+            connection = self._checkout()
+            try:
+                cursor = connection.cursor()
+                cursor.execute(query, params)
+
+                # Get column names once and share them across all rows
+                columns = tuple(desc[0] for desc in cursor.description)
+
+                results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+                cursor.close()
+                return results
+            finally:
+                self._pool.putconn(connection)
         except Exception as e:
             self.logger.error(f"Error executing PostgreSQL query: {e}")
             return None
-            
+
+    def describe_columns(self, query: str) -> Optional[list]:
+        """Return (column_name, type_oid) pairs without fetching rows"""
+        try:
+            self._ensure_connected()
+
+            connection = self._checkout()
+            try:
+                cursor = connection.cursor()
+                cursor.execute(query)
+                description = [(desc[0], desc[1]) for desc in cursor.description]
+                cursor.close()
+                return description
+            finally:
+                self._pool.putconn(connection)
+        except Exception as e:
+            self.logger.error(f"Error describing PostgreSQL query: {e}")
+            return None
+
+    def execute_query_iter(self, query: str, chunk_size: int = 50000, params: tuple = None, as_dict: bool = True):
+        """Stream query results via a server-side cursor as chunks of rows
+
+        Rows are dicts by default; as_dict=False yields the driver tuples
+        in column order, skipping one dict allocation per row.
+        """
+        try:
+            self._ensure_connected()
+
+            connection = self._checkout()
+            try:
+                cursor = connection.cursor(name=f"stream_{uuid.uuid4().hex}")
+                cursor.itersize = chunk_size
+                cursor.execute(query, params)
+
+                columns = None
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    if not as_dict:
+                        yield rows
+                        continue
+                    if columns is None:
+                        columns = tuple(desc[0] for desc in cursor.description)
+                    yield [dict(zip(columns, row)) for row in rows]
+
+                cursor.close()
+            finally:
+                self._pool.putconn(connection)
+        except Exception as e:
+            self.logger.error(f"Error streaming PostgreSQL query: {e}")
+
     def close(self):
-        if self.connection:
-            self.connection.close()
-        if self.engine:
-            self.engine.dispose()
\ No newline at end of file
+        if self._pool:
+            if self.connection:
+                self._pool.putconn(self.connection)
+                self.connection = None
+            self._pool.closeall()
+            self._pool = None
+        if self._engine:
+            self._engine.dispose()
+            self._engine = None
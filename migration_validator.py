@@ -15,8 +15,16 @@ Usage:
 
 import argparse
 import yaml
+try:
+    # libyaml-backed loader parses much faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 import logging
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, Any, List
 from db_connection import DB2Connection, PostgreSQLConnection
@@ -41,32 +49,53 @@ class MigrationValidator:
         
     def setup_logging(self):
         """Setup logging configuration"""
+        self._log_listener = None
+
+        # Idempotent: a second validator in the same process must not
+        # stack duplicate handlers and double-log every record
+        if logging.getLogger().handlers:
+            return
+
         log_level = self.config.get('logging', {}).get('level', 'INFO')
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        
-        logging.basicConfig(
-            level=getattr(logging, log_level.upper()),
-            format=log_format,
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler('migration_validation.log')
-            ]
-        )
+
+        formatter = logging.Formatter(log_format)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        # delay=True defers opening the file until the first record arrives
+        file_handler = logging.FileHandler('migration_validation.log', delay=True)
+        stream_handler.setFormatter(formatter)
+        file_handler.setFormatter(formatter)
+
+        # Worker threads enqueue records; a single background listener does
+        # the actual stream/file I/O, so the parallel table validations never
+        # contend on handler locks
+        log_queue = queue.Queue(-1)
+        root = logging.getLogger()
+        root.setLevel(getattr(logging, log_level.upper()))
+        root.addHandler(QueueHandler(log_queue))
+
+        self._log_listener = QueueListener(log_queue, stream_handler, file_handler)
+        self._log_listener.start()
     
     def validate_connections(self) -> bool:
         """Test database connections"""
         self.logger.info("Testing database connections...")
-        
-        db2_ok = self.db2_conn.test_connection()
+
+        # Ping both databases concurrently; report every failure instead of
+        # stopping at the first one
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            db2_future = executor.submit(self.db2_conn.test_connection)
+            pg_future = executor.submit(self.pg_conn.test_connection)
+            db2_ok = db2_future.result()
+            pg_ok = pg_future.result()
+
         if not db2_ok:
             self.logger.error("Failed to connect to DB2")
-            return False
-            
-        pg_ok = self.pg_conn.test_connection()
         if not pg_ok:
             self.logger.error("Failed to connect to PostgreSQL")
+        if not (db2_ok and pg_ok):
             return False
-            
+
         self.logger.info("Database connections successful")
         return True
     
@@ -85,17 +114,19 @@ class MigrationValidator:
             self.logger.error(f"Schema validation failed: {e}")
             raise
     
-    def run_data_validation(self, tables: List[str] = None) -> Dict[str, Any]:
+    def run_data_validation(self, tables: List[str] = None, schema_results: Dict[str, Any] = None) -> Dict[str, Any]:
         """Run data validation"""
         self.logger.info("Starting data validation...")
-        
+
         db2_schema = self.config['validation']['db2_schema']
         pg_schema = self.config['validation'].get('postgresql_schema', 'public')
-        
+
         try:
             if not tables:
-                # Get common tables from schema validation
-                schema_results = self.run_schema_validation()
+                # Get common tables from schema validation, reusing results
+                # the caller already computed
+                if schema_results is None:
+                    schema_results = self.run_schema_validation()
                 tables = list(schema_results['table_comparison']['common'])
                 
             if not tables:
@@ -108,7 +139,10 @@ class MigrationValidator:
                 tables = tables[:max_tables]
                 self.logger.info(f"Limiting validation to first {max_tables} tables")
             
-            data_results = self.data_validator.comprehensive_data_validation(tables, db2_schema, pg_schema)
+            self.data_validator.skip_checksum_on_count_mismatch = \
+                self.config['validation'].get('skip_checksum_on_count_mismatch', True)
+            max_workers = self.config.get('advanced', {}).get('max_workers', 4)
+            data_results = self.data_validator.comprehensive_data_validation(tables, db2_schema, pg_schema, max_workers)
             self.logger.info("Data validation completed successfully")
             return data_results
         except Exception as e:
@@ -147,7 +181,7 @@ class MigrationValidator:
         
         # Run validations
         schema_results = self.run_schema_validation()
-        data_results = self.run_data_validation()
+        data_results = self.run_data_validation(schema_results=schema_results)
         
         # Generate reports
         reports = self.generate_reports(schema_results, data_results)
@@ -200,12 +234,15 @@ class MigrationValidator:
         self.db2_conn.close()
         self.pg_conn.close()
         self.logger.info("Database connections closed")
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
 
 def load_config(config_file: str) -> Dict[str, Any]:
     """Load configuration from YAML file"""
     try:
         with open(config_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YamlLoader)
         return config
     except Exception as e:
         print(f"Error loading config file {config_file}: {e}")
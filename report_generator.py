@@ -1,7 +1,22 @@
 import json
-import pandas as pd
+try:
+    # orjson serializes in C straight to bytes, several times faster than
+    # the stdlib encoder on large result payloads
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    # Compiled templates render through buffered writes instead of Python
+    # string concatenation, and auto-escape for free
+    import jinja2
+except ImportError:
+    jinja2 = None
+import openpyxl
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+from typing import Dict, Any, List, Optional
 import logging
 from tabulate import tabulate
 from colorama import Fore, Style, init
@@ -9,20 +24,93 @@ from colorama import Fore, Style, init
 # Initialize colorama
 init(autoreset=True)
 
+# Pre-rendered console fragments so the hot report loops do no color
+# concatenation of their own; .format only substitutes the variable part
+_CYAN_BAR = f"{Fore.CYAN}{'=' * 80}"
+_SECTION_TMPL = f"\n{Fore.YELLOW}{{}}{Style.RESET_ALL}"
+_TABLE_HEADER_TMPL = f"\nTable: {Fore.CYAN}{{}}{Style.RESET_ALL}"
+_MISSING_COL_TMPL = f"  {Fore.RED}Missing Column:{Style.RESET_ALL} {{}}"
+_EXTRA_COL_TMPL = f"  {Fore.YELLOW}Extra Column:{Style.RESET_ALL} {{}}"
+_TYPE_MISMATCH_TMPL = (
+    f"  {Fore.YELLOW}Type Mismatch:{Style.RESET_ALL} {{}} (DB2: {{}}, PG: {{}})")
+
+# Row templates parsed once at import; the loops only pay for .format()
+_SCHEMA_DIFF_ROW_TMPL = (
+    "<tr><td>{table}</td><td>{issue_type}</td><td>{column}</td><td>{details}</td></tr>")
+_ROW_COUNT_ROW_TMPL = (
+    "<tr><td>{table}</td><td>{db2_count}</td><td>{postgresql_count}</td><td>{difference}</td></tr>")
+
+# Table and column names repeat across many rows; memoizing the escape
+# turns the per-row cost into a cache hit per unique value
+_escape_cached = lru_cache(maxsize=1024)(escape)
+
+def _escape_html(value):
+    """Escape strings for HTML interpolation; non-strings pass through"""
+    return _escape_cached(value) if isinstance(value, str) else value
+
+_TEMPLATE_DIR = Path(__file__).resolve().parent / 'templates'
+
 class ReportGenerator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        
-    def generate_console_report(self, schema_results: Dict[str, Any], data_results: Dict[str, Any]) -> str:
+
+    @staticmethod
+    def _render_rows(rows, template: str) -> str:
+        """Join template-formatted rows in one C-level pass, escaped for HTML"""
+        return ''.join(
+            template.format(**{key: _escape_html(value) for key, value in row.items()})
+            for row in rows)
+
+    @staticmethod
+    def _flatten_schema_diffs(schema_results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Flatten nested schema differences into one row dict per issue
+
+        Built once per report run and handed to the HTML and Excel
+        renderers, so each format does not re-walk the nested structure.
+        """
+        rows = []
+        for table_diff in schema_results.get('schema_differences') or []:
+            for diff in table_diff['differences']:
+                db2_type = diff.get('db2_type', '')
+                pg_type = diff.get('postgresql_type', '')
+                details = ""
+                if diff['type'] == 'data_type_mismatch':
+                    details = f"DB2: {db2_type}, PostgreSQL: {pg_type}"
+                rows.append({
+                    'table': table_diff['table'],
+                    'type': diff['type'],
+                    'issue_type': diff['type'].replace('_', ' ').title(),
+                    'column': diff['column'],
+                    'details': details,
+                    'db2_type': db2_type,
+                    'postgresql_type': pg_type
+                })
+        return rows
+
+    @staticmethod
+    def _iter_row_count_rows(comparisons):
+        """Yield one flat dict per row-count mismatch, ready for formatting"""
+        for issue in comparisons:
+            if not issue.get('match', False):
+                yield {
+                    'table': issue['table'],
+                    'db2_count': issue.get('db2_count', 'Error'),
+                    'postgresql_count': issue.get('postgresql_count', 'Error'),
+                    'difference': issue.get('difference', 'N/A')
+                }
+
+    def generate_console_report(self, schema_results: Dict[str, Any], data_results: Dict[str, Any],
+                                timestamp: datetime = None) -> str:
         """Generate colorized console report"""
+        timestamp = timestamp or datetime.now()
         report = []
-        report.append(f"\n{Fore.CYAN}{'='*80}")
+        report.append(f"\n{_CYAN_BAR}")
         report.append(f"{Fore.CYAN}DB2 TO POSTGRESQL MIGRATION VALIDATION REPORT")
-        report.append(f"{Fore.CYAN}Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"{Fore.CYAN}{'='*80}{Style.RESET_ALL}")
+        report.append(f"{Fore.CYAN}Generated: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+        report.append(f"{_CYAN_BAR}{Style.RESET_ALL}")
         
         # Schema Validation Summary
-        report.append(f"\n{Fore.YELLOW}SCHEMA VALIDATION SUMMARY{Style.RESET_ALL}")
+        report.append(_SECTION_TMPL.format("SCHEMA VALIDATION SUMMARY"))
         report.append("-" * 40)
         
         if 'summary' in schema_results:
@@ -39,33 +127,32 @@ class ReportGenerator:
             
             if tc['db2_only']:
                 report.append(f"\n{Fore.RED}Tables Missing in PostgreSQL:{Style.RESET_ALL}")
-                for table in tc['db2_only']:
-                    report.append(f"  - {table}")
-                    
+                report.extend(f"  - {table}" for table in tc['db2_only'])
+
             if tc['postgresql_only']:
                 report.append(f"\n{Fore.YELLOW}Extra Tables in PostgreSQL:{Style.RESET_ALL}")
-                for table in tc['postgresql_only']:
-                    report.append(f"  - {table}")
+                report.extend(f"  - {table}" for table in tc['postgresql_only'])
         
         # Schema Differences
         if 'schema_differences' in schema_results and schema_results['schema_differences']:
-            report.append(f"\n{Fore.YELLOW}SCHEMA DIFFERENCES{Style.RESET_ALL}")
+            report.append(_SECTION_TMPL.format("SCHEMA DIFFERENCES"))
             report.append("-" * 40)
-            
+
             for table_diff in schema_results['schema_differences']:
-                report.append(f"\nTable: {Fore.CYAN}{table_diff['table']}{Style.RESET_ALL}")
-                
+                report.append(_TABLE_HEADER_TMPL.format(table_diff['table']))
+
                 for diff in table_diff['differences']:
                     if diff['type'] == 'missing_in_postgresql':
-                        report.append(f"  {Fore.RED}Missing Column:{Style.RESET_ALL} {diff['column']}")
+                        report.append(_MISSING_COL_TMPL.format(diff['column']))
                     elif diff['type'] == 'missing_in_db2':
-                        report.append(f"  {Fore.YELLOW}Extra Column:{Style.RESET_ALL} {diff['column']}")
+                        report.append(_EXTRA_COL_TMPL.format(diff['column']))
                     elif diff['type'] == 'data_type_mismatch':
-                        report.append(f"  {Fore.YELLOW}Type Mismatch:{Style.RESET_ALL} {diff['column']} (DB2: {diff['db2_type']}, PG: {diff['postgresql_type']})")
+                        report.append(_TYPE_MISMATCH_TMPL.format(
+                            diff['column'], diff['db2_type'], diff['postgresql_type']))
         
         # Data Validation Summary
         if data_results:
-            report.append(f"\n{Fore.YELLOW}DATA VALIDATION SUMMARY{Style.RESET_ALL}")
+            report.append(_SECTION_TMPL.format("DATA VALIDATION SUMMARY"))
             report.append("-" * 40)
             
             if 'summary' in data_results:
@@ -99,32 +186,93 @@ class ReportGenerator:
             if checksum_issues:
                 report.append(f"\n{Fore.RED}DATA CHECKSUM MISMATCHES{Style.RESET_ALL}")
                 report.append("-" * 35)
-                
-                for issue in checksum_issues:
-                    report.append(f"  - {issue['table']}")
-        
-        report.append(f"\n{Fore.CYAN}{'='*80}{Style.RESET_ALL}")
+                report.extend(f"  - {issue['table']}" for issue in checksum_issues)
         
+        report.append(f"\n{_CYAN_BAR}{Style.RESET_ALL}")
+
         return '\n'.join(report)
     
-    def generate_json_report(self, schema_results: Dict[str, Any], data_results: Dict[str, Any], filename: str = None) -> str:
-        """Generate JSON report"""
+    def generate_json_report(self, schema_results: Dict[str, Any], data_results: Dict[str, Any],
+                             filename: str = None, return_string: bool = True,
+                             timestamp: datetime = None) -> Optional[str]:
+        """Generate JSON report
+
+        When writing to a file the report streams through a 1 MiB buffered
+        handle, and the in-memory string is only built when the caller asks
+        for it via return_string — serializing twice doubles peak memory.
+        """
         report_data = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': (timestamp or datetime.now()).isoformat(),
             'schema_validation': schema_results,
             'data_validation': data_results
         }
-        
+
+        if orjson is not None:
+            payload = orjson.dumps(report_data, option=orjson.OPT_INDENT_2)
+            if filename:
+                with open(filename, 'wb', buffering=1 << 20) as f:
+                    f.write(payload)
+                self.logger.info(f"JSON report saved to {filename}")
+            return payload.decode('utf-8') if return_string else None
+
         if filename:
-            with open(filename, 'w', encoding='utf-8') as f:
+            # json.dump emits many small fragments; the buffer coalesces
+            # them into large sequential writes with no intermediate string
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 json.dump(report_data, f, indent=2, ensure_ascii=False)
             self.logger.info(f"JSON report saved to {filename}")
-            
+            if not return_string:
+                return None
+
         return json.dumps(report_data, indent=2, ensure_ascii=False)
     
-    def generate_html_report(self, schema_results: Dict[str, Any], data_results: Dict[str, Any], filename: str = None) -> str:
+    _html_template = None
+
+    @classmethod
+    def _get_html_template(cls):
+        """Compiled Jinja2 report template, loaded once per process"""
+        if cls._html_template is None:
+            env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(str(_TEMPLATE_DIR)),
+                autoescape=True)
+            cls._html_template = env.get_template('report.html.j2')
+        return cls._html_template
+
+    def generate_html_report(self, schema_results: Dict[str, Any], data_results: Dict[str, Any],
+                             filename: str = None, timestamp: datetime = None,
+                             schema_diff_rows: List[Dict[str, Any]] = None) -> str:
         """Generate HTML report"""
-        html_content = f"""
+        timestamp = timestamp or datetime.now()
+        if schema_diff_rows is None:
+            schema_diff_rows = self._flatten_schema_diffs(schema_results)
+
+        if jinja2 is not None:
+            html_content = self._get_html_template().render(
+                schema=schema_results,
+                data=data_results,
+                timestamp=timestamp,
+                schema_diff_rows=schema_diff_rows,
+                row_count_rows=list(self._iter_row_count_rows(
+                    data_results.get('row_count_comparisons', []))))
+        else:
+            html_content = self._build_html(
+                schema_results, data_results, timestamp, schema_diff_rows)
+
+        if filename:
+            # 1 MiB buffer: multi-MB reports go out in a few large writes
+            # instead of the default 8 KiB syscall dribble
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(html_content)
+            self.logger.info(f"HTML report saved to {filename}")
+
+        return html_content
+
+    def _build_html(self, schema_results: Dict[str, Any], data_results: Dict[str, Any],
+                    timestamp: datetime, schema_diff_rows: List[Dict[str, Any]]) -> str:
+        """String-building HTML renderer, used when Jinja2 is unavailable"""
+        # Collect fragments and join once at the end; += in the nested loops
+        # below would recopy the whole document per iteration
+        parts = [f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -145,83 +293,69 @@ class ReportGenerator:
         <body>
             <div class="header">
                 <h1>DB2 to PostgreSQL Migration Validation Report</h1>
-                <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+                <p>Generated: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>
             </div>
-        """
-        
+        """]
+
         # Schema Validation Section
-        html_content += """
+        parts.append("""
             <div class="section">
                 <h2>Schema Validation Results</h2>
-        """
-        
+        """)
+
         if 'summary' in schema_results:
             summary = schema_results['summary']
-            html_content += f"""
+            parts.append(f"""
                 <div class="summary-box">
                     <h3>Summary</h3>
                     <p>Tables Migrated: <span class="success">{summary['tables_migrated']}</span></p>
                     <p>Tables Missing: <span class="error">{summary['tables_missing']}</span></p>
                     <p>Tables with Schema Issues: <span class="warning">{summary['tables_with_schema_issues']}</span></p>
                 </div>
-            """
-        
+            """)
+
         # Table Comparison
         if 'table_comparison' in schema_results:
             tc = schema_results['table_comparison']
-            html_content += f"""
+            parts.append(f"""
                 <h3>Table Comparison</h3>
                 <p>DB2 Tables: {tc['db2_total']}</p>
                 <p>PostgreSQL Tables: {tc['postgresql_total']}</p>
-            """
-            
+            """)
+
             if tc['db2_only']:
-                html_content += """
+                parts.append("""
                     <h4 class="error">Tables Missing in PostgreSQL</h4>
                     <ul>
-                """
+                """)
                 for table in tc['db2_only']:
-                    html_content += f"<li>{table}</li>"
-                html_content += "</ul>"
-        
+                    parts.append(f"<li>{_escape_html(table)}</li>")
+                parts.append("</ul>")
+
         # Schema Differences
-        if 'schema_differences' in schema_results and schema_results['schema_differences']:
-            html_content += """
+        if schema_diff_rows:
+            parts.append("""
                 <h3>Schema Differences</h3>
                 <table>
                     <tr><th>Table</th><th>Issue Type</th><th>Column</th><th>Details</th></tr>
-            """
-            
-            for table_diff in schema_results['schema_differences']:
-                for diff in table_diff['differences']:
-                    issue_type = diff['type'].replace('_', ' ').title()
-                    details = ""
-                    if diff['type'] == 'data_type_mismatch':
-                        details = f"DB2: {diff['db2_type']}, PostgreSQL: {diff['postgresql_type']}"
-                    
-                    html_content += f"""
-                        <tr>
-                            <td>{table_diff['table']}</td>
-                            <td>{issue_type}</td>
-                            <td>{diff['column']}</td>
-                            <td>{details}</td>
-                        </tr>
-                    """
-            
-            html_content += "</table>"
-        
-        html_content += "</div>"
-        
+            """)
+
+            parts.append(self._render_rows(schema_diff_rows, _SCHEMA_DIFF_ROW_TMPL))
+
+            parts.append("</table>")
+
+        parts.append("</div>")
+
         # Data Validation Section
         if data_results:
-            html_content += """
+            parts.append("""
                 <div class="section">
                     <h2>Data Validation Results</h2>
-            """
-            
+            """)
+
             if 'summary' in data_results:
                 summary = data_results['summary']
-                html_content += f"""
+                parts.append(f"""
                     <div class="summary-box">
                         <h3>Summary</h3>
                         <p>Total Tables Validated: {summary['total_tables']}</p>
@@ -231,123 +365,150 @@ class ReportGenerator:
                         <p>Data Type Validations Passed: <span class="success">{summary['data_type_passes']}</span></p>
                         <p>Overall Success Rate: <span class="success">{summary['overall_success_rate']:.1f}%</span></p>
                     </div>
-                """
-            
-            # Row Count Issues
-            row_count_issues = [r for r in data_results.get('row_count_comparisons', []) if not r.get('match', False)]
-            if row_count_issues:
-                html_content += """
+                """)
+
+            # Row Count Issues (rendered straight from a generator; the
+            # joined string doubles as the emptiness check)
+            row_count_rows = self._render_rows(
+                self._iter_row_count_rows(data_results.get('row_count_comparisons', [])),
+                _ROW_COUNT_ROW_TMPL)
+            if row_count_rows:
+                parts.append("""
                     <h3 class="error">Row Count Mismatches</h3>
                     <table>
                         <tr><th>Table</th><th>DB2 Count</th><th>PostgreSQL Count</th><th>Difference</th></tr>
-                """
-                
-                for issue in row_count_issues:
-                    html_content += f"""
-                        <tr>
-                            <td>{issue['table']}</td>
-                            <td>{issue.get('db2_count', 'Error')}</td>
-                            <td>{issue.get('postgresql_count', 'Error')}</td>
-                            <td>{issue.get('difference', 'N/A')}</td>
-                        </tr>
-                    """
-                
-                html_content += "</table>"
-            
-            html_content += "</div>"
-        
-        html_content += """
+                """)
+                parts.append(row_count_rows)
+                parts.append("</table>")
+
+            parts.append("</div>")
+
+        parts.append("""
             </body>
         </html>
+        """)
+
+        return ''.join(parts)
+
+    @staticmethod
+    def _cell(value):
+        """Coerce a value to something openpyxl can serialize"""
+        if value is None or isinstance(value, (int, float, str, bool, datetime)):
+            return value
+        return str(value)
+
+    def _append_records(self, ws, records: List[Dict[str, Any]],
+                        columns: tuple = ()) -> None:
+        """Stream a list of result dicts as a header row plus one row per record
+
+        columns fixes the leading column order up front so the scan below
+        only has to pick up stragglers (e.g. keys from error records).
         """
-        
-        if filename:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            self.logger.info(f"HTML report saved to {filename}")
-            
-        return html_content
-    
-    def generate_excel_report(self, schema_results: Dict[str, Any], data_results: Dict[str, Any], filename: str) -> None:
+        headers = list(columns)
+        seen = set(headers)
+        for record in records:
+            for key in record:
+                if key not in seen:
+                    seen.add(key)
+                    headers.append(key)
+        ws.append(headers)
+        for record in records:
+            ws.append([self._cell(record.get(key)) for key in headers])
+
+    def generate_excel_report(self, schema_results: Dict[str, Any], data_results: Dict[str, Any], filename: str,
+                              schema_diff_rows: List[Dict[str, Any]] = None) -> None:
         """Generate Excel report with multiple sheets"""
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # Summary sheet
-            summary_data = []
-            
-            if 'summary' in schema_results:
-                schema_summary = schema_results['summary']
-                summary_data.extend([
-                    ['Schema Validation', ''],
-                    ['Tables Migrated', schema_summary['tables_migrated']],
-                    ['Tables Missing', schema_summary['tables_missing']],
-                    ['Tables with Schema Issues', schema_summary['tables_with_schema_issues']],
-                    ['', '']
-                ])
-            
-            if 'summary' in data_results:
-                data_summary = data_results['summary']
-                summary_data.extend([
-                    ['Data Validation', ''],
-                    ['Total Tables', data_summary['total_tables']],
-                    ['Row Count Matches', data_summary['row_count_matches']],
-                    ['Checksum Matches', data_summary['checksum_matches']],
-                    ['Primary Key Matches', data_summary['primary_key_matches']],
-                    ['Data Type Passes', data_summary['data_type_passes']],
-                    ['Overall Success Rate (%)', f"{data_summary['overall_success_rate']:.1f}"]
+        # Write-only mode serializes each appended row and discards it, so
+        # only a small buffer stays resident — no DataFrame materialization
+        wb = openpyxl.Workbook(write_only=True)
+
+        # Summary sheet
+        summary_ws = wb.create_sheet('Summary')
+        summary_ws.append(['Metric', 'Value'])
+
+        if 'summary' in schema_results:
+            schema_summary = schema_results['summary']
+            for row in (
+                ['Schema Validation', ''],
+                ['Tables Migrated', schema_summary['tables_migrated']],
+                ['Tables Missing', schema_summary['tables_missing']],
+                ['Tables with Schema Issues', schema_summary['tables_with_schema_issues']],
+                ['', '']
+            ):
+                summary_ws.append(row)
+
+        if 'summary' in data_results:
+            data_summary = data_results['summary']
+            for row in (
+                ['Data Validation', ''],
+                ['Total Tables', data_summary['total_tables']],
+                ['Row Count Matches', data_summary['row_count_matches']],
+                ['Checksum Matches', data_summary['checksum_matches']],
+                ['Primary Key Matches', data_summary['primary_key_matches']],
+                ['Data Type Passes', data_summary['data_type_passes']],
+                ['Overall Success Rate (%)', f"{data_summary['overall_success_rate']:.1f}"]
+            ):
+                summary_ws.append(row)
+
+        # Schema differences sheet
+        if schema_diff_rows is None:
+            schema_diff_rows = self._flatten_schema_diffs(schema_results)
+        if schema_diff_rows:
+            schema_ws = wb.create_sheet('Schema Differences')
+            schema_ws.append(['Table', 'Issue Type', 'Column', 'DB2 Type', 'PostgreSQL Type'])
+            for row in schema_diff_rows:
+                schema_ws.append([
+                    row['table'],
+                    row['type'],
+                    row['column'],
+                    row['db2_type'],
+                    row['postgresql_type']
                 ])
-            
-            summary_df = pd.DataFrame(summary_data, columns=['Metric', 'Value'])
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-            
-            # Schema differences sheet
-            if 'schema_differences' in schema_results and schema_results['schema_differences']:
-                schema_diff_data = []
-                for table_diff in schema_results['schema_differences']:
-                    for diff in table_diff['differences']:
-                        schema_diff_data.append({
-                            'Table': table_diff['table'],
-                            'Issue Type': diff['type'],
-                            'Column': diff['column'],
-                            'DB2 Type': diff.get('db2_type', ''),
-                            'PostgreSQL Type': diff.get('postgresql_type', '')
-                        })
-                
-                schema_df = pd.DataFrame(schema_diff_data)
-                schema_df.to_excel(writer, sheet_name='Schema Differences', index=False)
-            
-            # Row count comparison sheet
-            if 'row_count_comparisons' in data_results:
-                row_count_df = pd.DataFrame(data_results['row_count_comparisons'])
-                row_count_df.to_excel(writer, sheet_name='Row Count Comparison', index=False)
-            
-            # Checksum comparison sheet
-            if 'checksum_comparisons' in data_results:
-                checksum_df = pd.DataFrame(data_results['checksum_comparisons'])
-                checksum_df.to_excel(writer, sheet_name='Checksum Comparison', index=False)
-        
+
+        # Row count comparison sheet
+        if 'row_count_comparisons' in data_results:
+            self._append_records(
+                wb.create_sheet('Row Count Comparison'), data_results['row_count_comparisons'],
+                columns=('table', 'db2_count', 'postgresql_count', 'match', 'difference'))
+
+        # Checksum comparison sheet
+        if 'checksum_comparisons' in data_results:
+            self._append_records(
+                wb.create_sheet('Checksum Comparison'), data_results['checksum_comparisons'],
+                columns=('table', 'db2_checksum', 'postgresql_checksum', 'match'))
+
+        wb.save(filename)
         self.logger.info(f"Excel report saved to {filename}")
     
     def generate_all_reports(self, schema_results: Dict[str, Any], data_results: Dict[str, Any], base_filename: str = None) -> Dict[str, str]:
         """Generate all report formats"""
+        # One clock reading shared by every format, so the stamps agree
+        now = datetime.now()
         if not base_filename:
-            base_filename = f"migration_validation_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
+            base_filename = f"migration_validation_{now.strftime('%Y%m%d_%H%M%S')}"
+
         reports = {}
-        
+
+        # Walk the nested schema differences once; HTML and Excel both
+        # consume the flattened rows
+        schema_diff_rows = self._flatten_schema_diffs(schema_results)
+
         # Console report
-        reports['console'] = self.generate_console_report(schema_results, data_results)
-        
-        # JSON report
+        reports['console'] = self.generate_console_report(schema_results, data_results, timestamp=now)
+
+        # JSON report (written to disk only; nobody reads the string back)
         json_file = f"{base_filename}.json"
-        reports['json'] = self.generate_json_report(schema_results, data_results, json_file)
-        
+        self.generate_json_report(schema_results, data_results, json_file, return_string=False, timestamp=now)
+        reports['json'] = json_file
+
         # HTML report
         html_file = f"{base_filename}.html"
-        reports['html'] = self.generate_html_report(schema_results, data_results, html_file)
-        
+        reports['html'] = self.generate_html_report(
+            schema_results, data_results, html_file, timestamp=now, schema_diff_rows=schema_diff_rows)
+
         # Excel report
         excel_file = f"{base_filename}.xlsx"
-        self.generate_excel_report(schema_results, data_results, excel_file)
+        self.generate_excel_report(schema_results, data_results, excel_file, schema_diff_rows=schema_diff_rows)
         reports['excel'] = excel_file
         
         return reports
\ No newline at end of file
@@ -1,4 +1,8 @@
 import pandas as pd
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
 from typing import Dict, List, Any, Optional, Tuple
 import logging
 from db_connection import DB2Connection, PostgreSQLConnection
@@ -8,19 +12,37 @@ class SchemaValidator:
         self.db2_conn = db2_conn
         self.pg_conn = pg_conn
         self.logger = logging.getLogger(__name__)
-        
+        # Per-schema column/index maps; one catalog query each instead of
+        # two round-trips per table
+        self._db2_cols_cache: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._pg_cols_cache: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._db2_idx_cache: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._pg_idx_cache: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._last_table_lists = None
+
+    def invalidate_cache(self) -> None:
+        """Drop cached catalog data, e.g. after DDL between validation runs"""
+        self._db2_cols_cache.clear()
+        self._pg_cols_cache.clear()
+        self._db2_idx_cache.clear()
+        self._pg_idx_cache.clear()
+
     def get_db2_tables(self, schema: str = None) -> List[Dict[str, Any]]:
         """Get list of tables from DB2"""
+        # LOWER() in SQL so the driver returns already-normalized names and
+        # callers never pay a per-row .lower()
         query = """
-        SELECT TABSCHEMA, TABNAME, TYPE, REMARKS
-        FROM SYSCAT.TABLES 
+        SELECT TABSCHEMA, LOWER(TABNAME) AS TABNAME, TYPE, REMARKS
+        FROM SYSCAT.TABLES
         WHERE TYPE IN ('T', 'V')
         """
+        params = None
         if schema:
-            query += f" AND TABSCHEMA = '{schema.upper()}'"
+            query += " AND TABSCHEMA = ?"
+            params = (schema.upper(),)
         query += " ORDER BY TABSCHEMA, TABNAME"
-        
-        return self.db2_conn.execute_query(query) or []
+
+        return self.db2_conn.execute_query(query, params) or []
     
     def get_postgresql_tables(self, schema: str = 'public') -> List[Dict[str, Any]]:
         """Get list of tables from PostgreSQL"""
@@ -33,7 +55,7 @@ class SchemaValidator:
         
         # Convert to format similar to DB2 results
         results = []
-        pg_results = self.pg_conn.execute_query(query.replace('%s', f"'{schema}'"))
+        pg_results = self.pg_conn.execute_query(query, (schema,))
         
         if pg_results:
             for row in pg_results:
@@ -46,50 +68,74 @@ class SchemaValidator:
         
         return results
     
-    def get_db2_columns(self, schema: str, table: str) -> List[Dict[str, Any]]:
-        """Get column information from DB2"""
-        query = f"""
-        SELECT 
-            COLNAME, 
-            TYPENAME, 
-            LENGTH, 
-            SCALE, 
+    def _load_all_db2_columns(self, schema: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch columns for every table in a DB2 schema with one catalog query"""
+        if schema in self._db2_cols_cache:
+            return self._db2_cols_cache[schema]
+
+        query = """
+        SELECT
+            TABNAME,
+            COLNAME,
+            TYPENAME,
+            LENGTH,
+            SCALE,
             NULLS,
             DEFAULT,
             COLNO
-        FROM SYSCAT.COLUMNS 
-        WHERE TABSCHEMA = '{schema.upper()}' 
-        AND TABNAME = '{table.upper()}'
-        ORDER BY COLNO
+        FROM SYSCAT.COLUMNS
+        WHERE TABSCHEMA = ?
+        AND TABNAME IN (
+            SELECT TABNAME FROM SYSCAT.TABLES
+            WHERE TABSCHEMA = ? AND TYPE IN ('T', 'V')
+        )
+        ORDER BY TABNAME, COLNO
         """
-        
-        return self.db2_conn.execute_query(query) or []
-    
-    def get_postgresql_columns(self, schema: str, table: str) -> List[Dict[str, Any]]:
-        """Get column information from PostgreSQL"""
-        query = f"""
-        SELECT 
-            column_name, 
-            data_type, 
-            character_maximum_length, 
+
+        rows = self.db2_conn.execute_query(query, (schema.upper(), schema.upper())) or []
+
+        # Rows arrive sorted by table, so one groupby pass splits them
+        grouped = {}
+        for tabname, cols in groupby(rows, key=lambda row: row['tabname']):
+            grouped[tabname.lower()] = [
+                {key: value for key, value in col.items() if key != 'tabname'}
+                for col in cols
+            ]
+
+        self._db2_cols_cache[schema] = grouped
+        return grouped
+
+    def _load_all_postgresql_columns(self, schema: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch columns for every table in a PostgreSQL schema with one catalog query"""
+        if schema in self._pg_cols_cache:
+            return self._pg_cols_cache[schema]
+
+        query = """
+        SELECT
+            table_name,
+            column_name,
+            data_type,
+            character_maximum_length,
             numeric_precision,
             numeric_scale,
             is_nullable,
             column_default,
             ordinal_position
-        FROM information_schema.columns 
-        WHERE table_schema = '{schema}' 
-        AND table_name = '{table}'
-        ORDER BY ordinal_position
+        FROM information_schema.columns
+        WHERE table_schema = %s
+        AND table_name IN (
+            SELECT tablename FROM pg_tables WHERE schemaname = %s
+        )
+        ORDER BY table_name, ordinal_position
         """
-        
-        # Convert to format similar to DB2 results
-        results = []
-        pg_results = self.pg_conn.execute_query(query)
-        
-        if pg_results:
-            for row in pg_results:
-                results.append({
+
+        rows = self.pg_conn.execute_query(query, (schema, schema)) or []
+
+        # Convert to format similar to DB2 results, grouped per table
+        grouped = {}
+        for table_name, cols in groupby(rows, key=lambda row: row['table_name']):
+            grouped[table_name.lower()] = [
+                {
                     'colname': row['column_name'],
                     'typename': row['data_type'],
                     'length': row['character_maximum_length'] or row['numeric_precision'],
@@ -97,45 +143,81 @@ class SchemaValidator:
                     'nulls': 'Y' if row['is_nullable'] == 'YES' else 'N',
                     'default': row['column_default'],
                     'colno': row['ordinal_position']
-                })
-        
-        return results
+                }
+                for row in cols
+            ]
+
+        self._pg_cols_cache[schema] = grouped
+        return grouped
+
+    def get_db2_columns(self, schema: str, table: str) -> List[Dict[str, Any]]:
+        """Get column information from DB2"""
+        return self._load_all_db2_columns(schema).get(table.lower(), [])
+
+    def get_postgresql_columns(self, schema: str, table: str) -> List[Dict[str, Any]]:
+        """Get column information from PostgreSQL"""
+        return self._load_all_postgresql_columns(schema).get(table.lower(), [])
     
-    def get_db2_indexes(self, schema: str, table: str) -> List[Dict[str, Any]]:
-        """Get index information from DB2"""
-        query = f"""
-        SELECT 
+    def _load_all_db2_indexes(self, schema: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch indexes for every table in a DB2 schema with one catalog query"""
+        if schema in self._db2_idx_cache:
+            return self._db2_idx_cache[schema]
+
+        query = """
+        SELECT
+            i.TABNAME,
             i.INDNAME,
             i.UNIQUERULE,
             ic.COLNAME,
             ic.COLSEQ
         FROM SYSCAT.INDEXES i
         JOIN SYSCAT.INDEXCOLUSE ic ON i.INDNAME = ic.INDNAME
-        WHERE i.TABSCHEMA = '{schema.upper()}'
-        AND i.TABNAME = '{table.upper()}'
-        ORDER BY i.INDNAME, ic.COLSEQ
+        WHERE i.TABSCHEMA = ?
+        ORDER BY i.TABNAME, i.INDNAME, ic.COLSEQ
         """
-        
-        return self.db2_conn.execute_query(query) or []
-    
-    def get_postgresql_indexes(self, schema: str, table: str) -> List[Dict[str, Any]]:
-        """Get index information from PostgreSQL"""
-        query = f"""
-        SELECT 
+
+        grouped = defaultdict(list)
+        for row in self.db2_conn.execute_query(query, (schema.upper(),)) or []:
+            grouped[row['tabname'].lower()].append(
+                {key: value for key, value in row.items() if key != 'tabname'})
+
+        self._db2_idx_cache[schema] = dict(grouped)
+        return self._db2_idx_cache[schema]
+
+    def _load_all_postgresql_indexes(self, schema: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch indexes for every table in a PostgreSQL schema with one catalog query"""
+        if schema in self._pg_idx_cache:
+            return self._pg_idx_cache[schema]
+
+        query = """
+        SELECT
+            tablename,
             indexname,
             indexdef
-        FROM pg_indexes 
-        WHERE schemaname = '{schema}' 
-        AND tablename = '{table}'
+        FROM pg_indexes
+        WHERE schemaname = %s
+        ORDER BY tablename, indexname
         """
-        
-        return self.pg_conn.execute_query(query) or []
+
+        grouped = defaultdict(list)
+        for row in self.pg_conn.execute_query(query, (schema,)) or []:
+            grouped[row['tablename'].lower()].append(
+                {key: value for key, value in row.items() if key != 'tablename'})
+
+        self._pg_idx_cache[schema] = dict(grouped)
+        return self._pg_idx_cache[schema]
+
+    def get_db2_indexes(self, schema: str, table: str) -> List[Dict[str, Any]]:
+        """Get index information from DB2"""
+        return self._load_all_db2_indexes(schema).get(table.lower(), [])
+
+    def get_postgresql_indexes(self, schema: str, table: str) -> List[Dict[str, Any]]:
+        """Get index information from PostgreSQL"""
+        return self._load_all_postgresql_indexes(schema).get(table.lower(), [])
     
-    def compare_tables(self, db2_schema: str, pg_schema: str = 'public') -> Dict[str, Any]:
-        """Compare tables between DB2 and PostgreSQL"""
-        db2_tables = {t['tabname'].lower() for t in self.get_db2_tables(db2_schema)}
-        pg_tables = {t['tabname'].lower() for t in self.get_postgresql_tables(pg_schema)}
-        
+    @staticmethod
+    def _compare_table_sets(db2_tables: frozenset, pg_tables: frozenset) -> Dict[str, Any]:
+        """Build the table-comparison dict from two name sets"""
         return {
             'db2_only': db2_tables - pg_tables,
             'postgresql_only': pg_tables - db2_tables,
@@ -143,6 +225,19 @@ class SchemaValidator:
             'db2_total': len(db2_tables),
             'postgresql_total': len(pg_tables)
         }
+
+    def compare_tables(self, db2_schema: str, pg_schema: str = 'public') -> Dict[str, Any]:
+        """Compare tables between DB2 and PostgreSQL"""
+        # DB2 names arrive lowered by the catalog query and PG unquoted
+        # identifiers are lowercase already; frozensets hash each name once
+        db2_rows = self.get_db2_tables(db2_schema)
+        pg_rows = self.get_postgresql_tables(pg_schema)
+        # Keep the full rows around for callers that want more than names
+        self._last_table_lists = (db2_rows, pg_rows)
+
+        return self._compare_table_sets(
+            frozenset(t['tabname'] for t in db2_rows),
+            frozenset(t['tabname'] for t in pg_rows))
     
     def compare_table_schema(self, table_name: str, db2_schema: str, pg_schema: str = 'public') -> Dict[str, Any]:
         """Compare schema of a specific table"""
@@ -152,40 +247,42 @@ class SchemaValidator:
         # Create column mappings
         db2_col_map = {col['colname'].lower(): col for col in db2_cols}
         pg_col_map = {col['colname'].lower(): col for col in pg_cols}
-        
-        db2_col_names = set(db2_col_map.keys())
-        pg_col_names = set(pg_col_map.keys())
-        
+
         differences = []
-        
-        # Check for missing columns
-        for col in db2_col_names - pg_col_names:
-            differences.append({
-                'type': 'missing_in_postgresql',
-                'column': col,
-                'db2_info': db2_col_map[col]
-            })
-            
-        for col in pg_col_names - db2_col_names:
+
+        # One pass over the DB2 columns classifies each as missing or
+        # type-mismatched via a single dict lookup — no intermediate name
+        # sets for the difference/intersection
+        for col, db2_col in db2_col_map.items():
+            pg_col = pg_col_map.get(col)
+            if pg_col is None:
+                differences.append({
+                    'type': 'missing_in_postgresql',
+                    'column': col,
+                    'db2_info': db2_col
+                })
+                continue
+            db2_type = db2_col['typename']
+            pg_type = pg_col['typename']
+            # Identical spellings normalize identically — skip both
+            # normalization calls on the common already-equal case
+            if db2_type != pg_type and \
+                    self._normalize_data_type(db2_type) != self._normalize_data_type(pg_type):
+                differences.append({
+                    'type': 'data_type_mismatch',
+                    'column': col,
+                    'db2_type': db2_type,
+                    'postgresql_type': pg_type
+                })
+
+        # Key-view difference is the only set this comparison builds
+        for col in pg_col_map.keys() - db2_col_map.keys():
             differences.append({
                 'type': 'missing_in_db2',
                 'column': col,
                 'postgresql_info': pg_col_map[col]
             })
         
-        # Check for data type differences in common columns
-        for col in db2_col_names & pg_col_names:
-            db2_col = db2_col_map[col]
-            pg_col = pg_col_map[col]
-            
-            if self._normalize_data_type(db2_col['typename']) != self._normalize_data_type(pg_col['typename']):
-                differences.append({
-                    'type': 'data_type_mismatch',
-                    'column': col,
-                    'db2_type': db2_col['typename'],
-                    'postgresql_type': pg_col['typename']
-                })
-        
         return {
             'table': table_name,
             'differences': differences,
@@ -193,39 +290,62 @@ class SchemaValidator:
             'postgresql_columns': len(pg_cols)
         }
     
-    def _normalize_data_type(self, data_type: str) -> str:
-        """Normalize data types for comparison"""
-        type_mapping = {
-            'INTEGER': 'integer',
-            'BIGINT': 'bigint',
-            'SMALLINT': 'smallint',
-            'DECIMAL': 'numeric',
-            'DOUBLE': 'double precision',
-            'REAL': 'real',
-            'VARCHAR': 'character varying',
-            'CHARACTER': 'character',
-            'CHAR': 'character',
-            'CLOB': 'text',
-            'DATE': 'date',
-            'TIME': 'time without time zone',
-            'TIMESTAMP': 'timestamp without time zone'
-        }
-        
-        return type_mapping.get(data_type.upper(), data_type.lower())
+    # Built once at class creation; DB2 TYPENAMEs are already uppercase,
+    # so most lookups hit without any per-call .upper() allocation
+    _TYPE_MAP = {
+        'INTEGER': 'integer',
+        'BIGINT': 'bigint',
+        'SMALLINT': 'smallint',
+        'DECIMAL': 'numeric',
+        'DOUBLE': 'double precision',
+        'REAL': 'real',
+        'VARCHAR': 'character varying',
+        'CHARACTER': 'character',
+        'CHAR': 'character',
+        'CLOB': 'text',
+        'DATE': 'date',
+        'TIME': 'time without time zone',
+        'TIMESTAMP': 'timestamp without time zone'
+    }
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _normalize_data_type(data_type: str) -> str:
+        """Normalize data types for comparison
+
+        Memoized: a schema only contains a few dozen distinct type names,
+        so after warmup every call is a single cache hit.
+        """
+        mapped = (SchemaValidator._TYPE_MAP.get(data_type)
+                  or SchemaValidator._TYPE_MAP.get(data_type.upper()))
+        return mapped or data_type.lower()
     
     def validate_schema_migration(self, db2_schema: str, pg_schema: str = 'public') -> Dict[str, Any]:
         """Complete schema validation between DB2 and PostgreSQL"""
         self.logger.info(f"Starting schema validation: DB2({db2_schema}) -> PostgreSQL({pg_schema})")
         
-        # Compare tables
-        table_comparison = self.compare_tables(db2_schema, pg_schema)
-        
-        # Compare schema for common tables
+        # Warm the column caches first: one catalog query per side covers
+        # every per-table comparison below, and the cache keys double as
+        # the table lists — the column queries filter to the same object
+        # types as the listing queries, so the lists agree with
+        # compare_tables and the separate listing queries are skipped
+        db2_cols = self._load_all_db2_columns(db2_schema)
+        pg_cols = self._load_all_postgresql_columns(pg_schema)
+
+        table_comparison = self._compare_table_sets(
+            frozenset(db2_cols), frozenset(pg_cols))
+
+        # Compare schema for common tables; comparisons are independent, so
+        # threads overlap whatever catalog I/O the warm-up above left behind
+        common = table_comparison['common']
         table_schema_comparisons = []
-        for table in table_comparison['common']:
-            schema_comp = self.compare_table_schema(table, db2_schema, pg_schema)
-            if schema_comp['differences']:
-                table_schema_comparisons.append(schema_comp)
+        if common:
+            with ThreadPoolExecutor(max_workers=min(16, len(common))) as executor:
+                comparisons = executor.map(
+                    lambda table: self.compare_table_schema(table, db2_schema, pg_schema),
+                    common)
+                table_schema_comparisons = [
+                    schema_comp for schema_comp in comparisons if schema_comp['differences']]
         
         return {
             'table_comparison': table_comparison,